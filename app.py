@@ -8,16 +8,21 @@ Usage:
 
 import streamlit as st
 import logging
+import time
 from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
 
 from config import (
     APP_TITLE, APP_ICON, COMPANY_NAME, COMPANY_TAGLINE,
-    GROQ_API_KEY, SENTIMENT_MAP,
+    GROQ_API_KEY, SENTIMENT_MAP, STREAM_FLUSH_INTERVAL,
 )
 from models import ConversationState, CandidateInfo
-from llm_client import LLMClient
-from conversation import ConversationManager
-from utils import export_candidate_data, parse_technical_questions
+from utils import export_candidate_data, parse_technical_questions, clear_pii_cache
+
+if TYPE_CHECKING:
+    # Imported lazily in start_conversation() — they pull in the Groq SDK
+    from conversation import ConversationManager
 
 # ──────────────────────────────────────────────
 # Page Configuration
@@ -32,292 +37,66 @@ st.set_page_config(
 # ──────────────────────────────────────────────
 # Custom CSS — Premium Dark Theme
 # ──────────────────────────────────────────────
-st.markdown("""
-<style>
-    /* ── Import Google Fonts ── */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-
-    /* ── Global Styles ── */
-    .stApp {
-        font-family: 'Inter', sans-serif;
-    }
-
-    /* ── Hide Streamlit branding ── */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    .stDeployButton {display: none !important;}
-    [data-testid="stToolbar"] [data-testid="stToolbarActions"] {display: none !important;}
+CSS_PATH = Path(__file__).with_name("styles.css")
 
-    /* ── Sidebar Styling ── */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #0f0f23 0%, #1a1a3e 50%, #0f0f23 100%);
-        border-right: 1px solid rgba(99, 102, 241, 0.2);
-    }
 
-    [data-testid="stSidebar"] .stMarkdown h1,
-    [data-testid="stSidebar"] .stMarkdown h2,
-    [data-testid="stSidebar"] .stMarkdown h3 {
-        color: #a5b4fc !important;
-    }
+@st.cache_data(show_spinner=False)
+def load_css(mtime: float) -> str:
+    """
+    Read the stylesheet and wrap it in a <style> tag.
 
-    /* ── Main Chat Area ── */
-    .main .block-container {
-        padding-top: 2rem;
-        max-width: 800px;
-    }
+    Keyed on the file's modification time so edits during development
+    are picked up without restarting the server.
+    """
+    return f"<style>\n{CSS_PATH.read_text(encoding='utf-8')}</style>"
 
-    /* ── Chat Message Styling ── */
-    [data-testid="stChatMessage"] {
-        background: rgba(15, 15, 35, 0.6);
-        backdrop-filter: blur(12px);
-        border: 1px solid rgba(99, 102, 241, 0.15);
-        border-radius: 16px;
-        padding: 1rem 1.25rem;
-        margin-bottom: 0.75rem;
-        transition: all 0.3s ease;
-        animation: fadeIn 0.4s ease-out;
-    }
-
-    [data-testid="stChatMessage"]:hover {
-        border-color: rgba(99, 102, 241, 0.35);
-        box-shadow: 0 4px 20px rgba(99, 102, 241, 0.08);
-    }
-
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(8px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-
-    /* ── Hero Header Card ── */
-    .hero-card {
-        background: linear-gradient(135deg, #1e1b4b 0%, #312e81 50%, #1e1b4b 100%);
-        border: 1px solid rgba(139, 92, 246, 0.3);
-        border-radius: 20px;
-        padding: 2rem;
-        margin-bottom: 1.5rem;
-        text-align: center;
-        position: relative;
-        overflow: hidden;
-    }
-    .hero-card::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        left: -50%;
-        width: 200%;
-        height: 200%;
-        background: radial-gradient(circle, rgba(139, 92, 246, 0.1) 0%, transparent 70%);
-        animation: pulse 4s ease-in-out infinite;
-    }
-    @keyframes pulse {
-        0%, 100% { transform: scale(1); opacity: 0.5; }
-        50% { transform: scale(1.05); opacity: 1; }
-    }
-    .hero-card h1 {
-        font-size: 1.8rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #a78bfa, #818cf8, #6366f1);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.5rem;
-        position: relative;
-    }
-    .hero-card p {
-        color: #c4b5fd;
-        font-size: 0.95rem;
-        font-weight: 300;
-        position: relative;
-    }
-
-    /* ── Progress Bar ── */
-    .progress-container {
-        background: rgba(15, 15, 35, 0.8);
-        border: 1px solid rgba(99, 102, 241, 0.2);
-        border-radius: 12px;
-        padding: 1rem;
-        margin: 0.75rem 0;
-    }
-    .progress-bar-bg {
-        background: rgba(99, 102, 241, 0.15);
-        border-radius: 8px;
-        height: 8px;
-        overflow: hidden;
-        margin-top: 0.5rem;
-    }
-    .progress-bar-fill {
-        height: 100%;
-        border-radius: 8px;
-        background: linear-gradient(90deg, #6366f1, #8b5cf6, #a78bfa);
-        transition: width 0.5s ease;
-    }
 
-    /* ── Candidate Info Card ── */
-    .info-card {
-        background: rgba(15, 15, 35, 0.8);
-        border: 1px solid rgba(99, 102, 241, 0.2);
-        border-radius: 12px;
-        padding: 1rem;
-        margin: 0.75rem 0;
-    }
-    .info-card .field-item {
-        padding: 0.35rem 0;
-        font-size: 0.85rem;
-        color: #e2e8f0;
-        border-bottom: 1px solid rgba(99, 102, 241, 0.08);
-    }
-    .info-card .field-item:last-child {
-        border-bottom: none;
-    }
-    .info-card .field-label {
-        color: #a5b4fc;
-        font-weight: 500;
-    }
-    .info-card .field-pending {
-        color: #64748b;
-        font-style: italic;
-    }
-
-    /* ── Sentiment Badge ── */
-    .sentiment-badge {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.35rem;
-        padding: 0.3rem 0.75rem;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        font-weight: 500;
-        background: rgba(99, 102, 241, 0.15);
-        border: 1px solid rgba(99, 102, 241, 0.25);
-        margin-top: 0.5rem;
-    }
-
-    /* ── State Badge ── */
-    .state-badge {
-        display: inline-block;
-        padding: 0.25rem 0.75rem;
-        border-radius: 20px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        margin-top: 0.5rem;
-    }
-    .state-greeting { background: rgba(34, 197, 94, 0.15); color: #4ade80; border: 1px solid rgba(34, 197, 94, 0.3); }
-    .state-gathering { background: rgba(59, 130, 246, 0.15); color: #60a5fa; border: 1px solid rgba(59, 130, 246, 0.3); }
-    .state-questions { background: rgba(249, 115, 22, 0.15); color: #fb923c; border: 1px solid rgba(249, 115, 22, 0.3); }
-    .state-closing { background: rgba(168, 85, 247, 0.15); color: #c084fc; border: 1px solid rgba(168, 85, 247, 0.3); }
-    .state-ended { background: rgba(107, 114, 128, 0.15); color: #9ca3af; border: 1px solid rgba(107, 114, 128, 0.3); }
-
-    /* ── Privacy Badge ── */
-    .privacy-notice {
-        background: rgba(16, 185, 129, 0.08);
-        border: 1px solid rgba(16, 185, 129, 0.2);
-        border-radius: 10px;
-        padding: 0.75rem;
-        margin: 0.75rem 0;
-        font-size: 0.8rem;
-        color: #6ee7b7;
-    }
-
-    /* ── Chat Input Styling ── */
-    [data-testid="stChatInput"] textarea {
-        border-radius: 12px !important;
-        border: 1px solid rgba(99, 102, 241, 0.3) !important;
-        background: rgba(15, 15, 35, 0.8) !important;
-    }
-    [data-testid="stChatInput"] textarea:focus {
-        border-color: rgba(139, 92, 246, 0.6) !important;
-        box-shadow: 0 0 0 2px rgba(139, 92, 246, 0.15) !important;
-    }
-
-    /* ── Button Styling ── */
-    .stButton > button {
-        background: linear-gradient(135deg, #6366f1, #8b5cf6) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 10px !important;
-        padding: 0.5rem 1.5rem !important;
-        font-weight: 500 !important;
-        transition: all 0.3s ease !important;
-    }
-    .stButton > button:hover {
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 15px rgba(99, 102, 241, 0.4) !important;
-    }
-
-    /* ── Divider ── */
-    .custom-divider {
-        height: 1px;
-        background: linear-gradient(90deg, transparent, rgba(99, 102, 241, 0.3), transparent);
-        margin: 1rem 0;
-    }
-
-    /* ── Question Card ── */
-    .question-card {
-        background: rgba(15, 15, 35, 0.6);
-        border: 1px solid rgba(99, 102, 241, 0.2);
-        border-radius: 14px;
-        padding: 1.25rem;
-        margin-bottom: 1rem;
-        transition: all 0.3s ease;
-    }
-    .question-card:hover {
-        border-color: rgba(99, 102, 241, 0.4);
-    }
-    .tech-header {
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #a78bfa;
-        margin-bottom: 0.75rem;
-        padding-bottom: 0.5rem;
-        border-bottom: 1px solid rgba(99, 102, 241, 0.15);
-    }
-    .question-label {
-        color: #e2e8f0;
-        font-size: 0.9rem;
-        font-weight: 400;
-        margin-bottom: 0.5rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.html(load_css(CSS_PATH.stat().st_mtime))
 
 
 # ──────────────────────────────────────────────
 # Session State Initialization
 # ──────────────────────────────────────────────
+def _session_defaults() -> dict:
+    """
+    Default value for every session state variable.
+    Built fresh on each call so sessions never share the mutable lists.
+    """
+    return {
+        "initialized": False,
+        "api_key_set": False,
+        "conversation_manager": None,
+        "chat_history": [],
+        "current_sentiment": "neutral",
+        "greeting_sent": False,
+        "parsed_questions": [],
+        "questions_submitted": False,
+        "export_blob": None,
+        "export_filename": "",
+    }
+
+
 def init_session_state():
     """Initialize all session state variables."""
     if "initialized" not in st.session_state:
-        st.session_state.initialized = False
-    if "api_key_set" not in st.session_state:
-        st.session_state.api_key_set = False
-    if "conversation_manager" not in st.session_state:
-        st.session_state.conversation_manager = None
-    if "chat_history" not in st.session_state:
-        st.session_state.chat_history = []
-    if "current_sentiment" not in st.session_state:
-        st.session_state.current_sentiment = "neutral"
-    if "greeting_sent" not in st.session_state:
-        st.session_state.greeting_sent = False
-    if "parsed_questions" not in st.session_state:
-        st.session_state.parsed_questions = []
-    if "questions_submitted" not in st.session_state:
-        st.session_state.questions_submitted = False
+        st.session_state.update(_session_defaults())
 
 
 def start_conversation(api_key: str = None):
     """Initialize the conversation manager and generate greeting."""
+    # Deferred so the setup screen renders without loading the LLM stack
+    from llm_client import LLMClient
+    from conversation import ConversationManager
+
     key = api_key or GROQ_API_KEY
     try:
         llm = LLMClient(api_key=key)
-        st.session_state.conversation_manager = ConversationManager(llm)
-        st.session_state.api_key_set = True
-        st.session_state.initialized = True
-        st.session_state.chat_history = []
-        st.session_state.greeting_sent = False
-        st.session_state.current_sentiment = "neutral"
-        st.session_state.parsed_questions = []
-        st.session_state.questions_submitted = False
+        st.session_state.update(
+            _session_defaults(),
+            conversation_manager=ConversationManager(llm),
+            api_key_set=True,
+            initialized=True,
+        )
         return True
     except ValueError as e:
         st.error(str(e))
@@ -326,14 +105,82 @@ def start_conversation(api_key: str = None):
 
 def reset_conversation():
     """Reset the conversation to start fresh."""
-    st.session_state.initialized = False
-    st.session_state.api_key_set = False
-    st.session_state.conversation_manager = None
-    st.session_state.chat_history = []
-    st.session_state.greeting_sent = False
-    st.session_state.current_sentiment = "neutral"
-    st.session_state.parsed_questions = []
-    st.session_state.questions_submitted = False
+    st.session_state.update(_session_defaults())
+    clear_pii_cache()  # Don't keep the finished candidate's raw PII in the export memo
+
+
+# ──────────────────────────────────────────────
+# Static HTML Fragments (built once at import)
+# ──────────────────────────────────────────────
+_BRANDING_HTML = f"""
+<div style="text-align: center; padding: 1rem 0;">
+    <div style="font-size: 3rem; margin-bottom: 0.5rem;">{APP_ICON}</div>
+    <h1 style="font-size: 1.4rem; margin: 0; background: linear-gradient(135deg, #a78bfa, #6366f1);
+               -webkit-background-clip: text; -webkit-text-fill-color: transparent;">
+        {COMPANY_NAME}
+    </h1>
+    <p style="color: #94a3b8; font-size: 0.75rem; margin-top: 0.25rem;">
+        {COMPANY_TAGLINE}
+    </p>
+</div>
+"""
+
+_HERO_HTML = f"""
+<div class="hero-card">
+    <h1>{APP_ICON} {COMPANY_NAME}</h1>
+    <p>AI-Powered Technical Screening Assistant</p>
+</div>
+"""
+
+_PRIVACY_HTML = """
+<div class="privacy-notice">
+    <strong>Data Privacy</strong><br>
+    Your data is encrypted and handled in compliance with GDPR.
+    We only collect information relevant to the hiring process.
+</div>
+"""
+
+_DIVIDER_HTML = '<div class="custom-divider"></div>'
+
+_STATE_LABELS = {
+    ConversationState.GREETING: ("Greeting", "state-greeting"),
+    ConversationState.GATHERING_INFO: ("Gathering Info", "state-gathering"),
+    ConversationState.TECH_QUESTIONS: ("Tech Questions", "state-questions"),
+    ConversationState.ANSWERING_QUESTIONS: ("Tech Q&A", "state-questions"),
+    ConversationState.CLOSING: ("Closing", "state-closing"),
+    ConversationState.ENDED: ("Completed", "state-ended"),
+}
+
+
+def _sentiment_badge_html(sentiment: str, sent_data: dict) -> str:
+    """Build the sidebar mood badge for a sentiment label."""
+    return f"""
+<div style="text-align: center; margin-top: 0.75rem;">
+    <span style="color: #94a3b8; font-size: 0.75rem;">CANDIDATE MOOD</span><br>
+    <span class="sentiment-badge" style="border-color: {sent_data['color']}30; color: {sent_data['color']};">
+        {sent_data['emoji']} {sentiment.capitalize()}
+    </span>
+</div>
+"""
+
+
+# Sentiment labels form a closed set, so every badge can be prebuilt;
+# unknown labels from the LLM fall back to neutral styling at render time
+_SENTIMENT_BADGES = {
+    name: _sentiment_badge_html(name, data) for name, data in SENTIMENT_MAP.items()
+}
+
+_PROFILE_FIELD_LABELS = {
+    "full_name": "Name",
+    "email": "Email",
+    "phone": "Phone",
+    "years_of_experience": "Experience",
+    "desired_positions": "Position",
+    "current_location": "Location",
+    "tech_stack": "Tech Stack",
+}
+_FIELD_VALUE_TPL = '<div class="field-item"><span class="field-label">{label}:</span> {value}</div>'
+_FIELD_PENDING_TPL = '<div class="field-item"><span class="field-label">{label}:</span> <span class="field-pending">Pending...</span></div>'
 
 
 # ──────────────────────────────────────────────
@@ -343,35 +190,16 @@ def render_sidebar():
     """Render the sidebar with branding, progress, and candidate info."""
     with st.sidebar:
         # Branding
-        st.markdown(f"""
-        <div style="text-align: center; padding: 1rem 0;">
-            <div style="font-size: 3rem; margin-bottom: 0.5rem;">{APP_ICON}</div>
-            <h1 style="font-size: 1.4rem; margin: 0; background: linear-gradient(135deg, #a78bfa, #6366f1);
-                       -webkit-background-clip: text; -webkit-text-fill-color: transparent;">
-                {COMPANY_NAME}
-            </h1>
-            <p style="color: #94a3b8; font-size: 0.75rem; margin-top: 0.25rem;">
-                {COMPANY_TAGLINE}
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_BRANDING_HTML, unsafe_allow_html=True)
 
-        st.markdown('<div class="custom-divider"></div>', unsafe_allow_html=True)
+        st.markdown(_DIVIDER_HTML, unsafe_allow_html=True)
 
         if st.session_state.conversation_manager:
             cm = st.session_state.conversation_manager
 
             # Conversation State
             state = cm.get_state()
-            state_labels = {
-                ConversationState.GREETING: ("Greeting", "state-greeting"),
-                ConversationState.GATHERING_INFO: ("Gathering Info", "state-gathering"),
-                ConversationState.TECH_QUESTIONS: ("Tech Questions", "state-questions"),
-                ConversationState.ANSWERING_QUESTIONS: ("Tech Q&A", "state-questions"),
-                ConversationState.CLOSING: ("Closing", "state-closing"),
-                ConversationState.ENDED: ("Completed", "state-ended"),
-            }
-            label, css_class = state_labels.get(state, ("Unknown", "state-ended"))
+            label, css_class = _STATE_LABELS.get(state, ("Unknown", "state-ended"))
             st.markdown(f"""
             <div style="text-align: center;">
                 <span style="color: #94a3b8; font-size: 0.75rem;">CURRENT PHASE</span><br>
@@ -379,7 +207,7 @@ def render_sidebar():
             </div>
             """, unsafe_allow_html=True)
 
-            st.markdown('<div class="custom-divider"></div>', unsafe_allow_html=True)
+            st.markdown(_DIVIDER_HTML, unsafe_allow_html=True)
 
             # Progress
             candidate = cm.get_candidate_info()
@@ -398,47 +226,25 @@ def render_sidebar():
 
             # Candidate Info Card
             st.markdown("#### Candidate Profile")
-            info = candidate.model_dump()
-            field_labels = {
-                "full_name": "Name",
-                "email": "Email",
-                "phone": "Phone",
-                "years_of_experience": "Experience",
-                "desired_positions": "Position",
-                "current_location": "Location",
-                "tech_stack": "Tech Stack",
-            }
-            html_fields = ""
-            for field, label in field_labels.items():
-                value = info.get(field)
-                if value:
-                    html_fields += f'<div class="field-item"><span class="field-label">{label}:</span> {value}</div>'
-                else:
-                    html_fields += f'<div class="field-item"><span class="field-label">{label}:</span> <span class="field-pending">Pending...</span></div>'
+            info = cm.get_candidate_info_dict()
+            html_fields = "".join(
+                _FIELD_VALUE_TPL.format(label=label, value=info.get(field))
+                if info.get(field) else _FIELD_PENDING_TPL.format(label=label)
+                for field, label in _PROFILE_FIELD_LABELS.items()
+            )
             st.markdown(f'<div class="info-card">{html_fields}</div>', unsafe_allow_html=True)
 
             # Sentiment
             sentiment = st.session_state.current_sentiment
-            sent_data = SENTIMENT_MAP.get(sentiment, SENTIMENT_MAP["neutral"])
-            st.markdown(f"""
-            <div style="text-align: center; margin-top: 0.75rem;">
-                <span style="color: #94a3b8; font-size: 0.75rem;">CANDIDATE MOOD</span><br>
-                <span class="sentiment-badge" style="border-color: {sent_data['color']}30; color: {sent_data['color']};">
-                    {sent_data['emoji']} {sentiment.capitalize()}
-                </span>
-            </div>
-            """, unsafe_allow_html=True)
+            badge = _SENTIMENT_BADGES.get(sentiment) or _sentiment_badge_html(
+                sentiment, SENTIMENT_MAP["neutral"]
+            )
+            st.markdown(badge, unsafe_allow_html=True)
 
-            st.markdown('<div class="custom-divider"></div>', unsafe_allow_html=True)
+            st.markdown(_DIVIDER_HTML, unsafe_allow_html=True)
 
             # Privacy Notice
-            st.markdown("""
-            <div class="privacy-notice">
-                <strong>Data Privacy</strong><br>
-                Your data is encrypted and handled in compliance with GDPR.
-                We only collect information relevant to the hiring process.
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_PRIVACY_HTML, unsafe_allow_html=True)
 
             # Action Buttons
             col1, col2 = st.columns(2)
@@ -448,12 +254,19 @@ def render_sidebar():
                     st.rerun()
             with col2:
                 if candidate.is_complete():
-                    if st.button("Export", use_container_width=True):
-                        data = export_candidate_data(candidate.model_dump())
+                    # Serialize only when asked, then keep the blob for the download button
+                    if st.session_state.export_blob is None:
+                        if st.button("Export", use_container_width=True):
+                            st.session_state.export_blob = export_candidate_data(candidate.to_validated_dict())
+                            st.session_state.export_filename = (
+                                f"candidate_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                            )
+                            st.rerun()
+                    else:
                         st.download_button(
                             "Download JSON",
-                            data,
-                            file_name=f"candidate_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                            st.session_state.export_blob,
+                            file_name=st.session_state.export_filename,
                             mime="application/json",
                             use_container_width=True,
                         )
@@ -505,7 +318,7 @@ def render_question_form():
                 )
                 all_answers[f"{tech_name} - Q{i+1}: {question}"] = answer
 
-            st.markdown('<div class="custom-divider"></div>', unsafe_allow_html=True)
+            st.markdown(_DIVIDER_HTML, unsafe_allow_html=True)
 
         submitted = st.form_submit_button(
             "Submit All Answers",
@@ -543,6 +356,117 @@ def render_question_form():
                 st.warning("Please answer at least one question before submitting.")
 
 
+# ──────────────────────────────────────────────
+# Chat Area
+# ──────────────────────────────────────────────
+def render_stream(chunks: Iterable[str]) -> str:
+    """
+    Render streamed text into a single placeholder, throttling redraws
+    to one every STREAM_FLUSH_INTERVAL seconds. Returns the full text.
+    """
+    placeholder = st.empty()
+    buffer = ""
+    last_flush = 0.0
+    for chunk in chunks:
+        buffer += chunk
+        now = time.monotonic()
+        if now - last_flush >= STREAM_FLUSH_INTERVAL:
+            placeholder.markdown(buffer + " ▌")
+            last_flush = now
+    placeholder.markdown(buffer)
+    return buffer
+
+
+def _sidebar_snapshot(cm: "ConversationManager") -> tuple:
+    """Capture everything the sidebar displays so staleness can be detected."""
+    return (
+        cm.get_state(),
+        cm.candidate_version,
+        st.session_state.current_sentiment,
+    )
+
+
+def _show_question_form(cm: "ConversationManager") -> bool:
+    """Whether the technical questions should be answered through the form."""
+    return bool(
+        cm.get_state() in (ConversationState.TECH_QUESTIONS, ConversationState.ANSWERING_QUESTIONS)
+        and st.session_state.parsed_questions
+        and not st.session_state.questions_submitted
+    )
+
+
+@st.fragment
+def render_chat():
+    """
+    Render the chat history, question form, and chat input.
+    Runs as a fragment so a new message only re-executes this part of the page;
+    a full rerun is triggered only when the sidebar needs refreshing.
+    """
+    cm = st.session_state.conversation_manager
+
+    # Display Chat History. New turns are written into the same container so
+    # they appear above the input even when the fragment is not rerun
+    history = st.container()
+    with history:
+        for msg in st.session_state.chat_history:
+            with st.chat_message(msg["role"]):
+                st.markdown(msg["content"])
+
+    if _show_question_form(cm):
+        # Show individual answer boxes for each question
+        render_question_form()
+    elif cm.is_ended():
+        st.markdown("""
+        <div style="text-align: center; padding: 1rem; color: #94a3b8;">
+            <p>This screening session has ended. Click <strong>New Chat</strong> in the sidebar to start a new one.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        # Inside a fragment the input has a layout parent, so pin it explicitly
+        if user_input := st.bottom.chat_input("Type your message here..."):
+            sidebar_before = _sidebar_snapshot(cm)
+
+            with history:
+                # Display user message
+                with st.chat_message("user"):
+                    st.markdown(user_input)
+                st.session_state.chat_history.append({
+                    "role": "user",
+                    "content": user_input,
+                })
+
+                # Get bot response
+                with st.chat_message("assistant"):
+                    with st.spinner("Thinking..."):
+                        response = render_stream(cm.stream_message(user_input))
+
+            st.session_state.chat_history.append({
+                "role": "assistant",
+                "content": response,
+            })
+
+            st.session_state.current_sentiment = cm.current_sentiment
+
+            # Check if tech questions were just generated — parse them
+            # Must re-check state AFTER process_message since it may have changed
+            current_state = cm.get_state()
+            if (
+                current_state in (ConversationState.TECH_QUESTIONS, ConversationState.ANSWERING_QUESTIONS)
+                and not st.session_state.parsed_questions
+                and cm.raw_tech_questions
+            ):
+                parsed = parse_technical_questions(cm.raw_tech_questions)
+                if parsed:
+                    st.session_state.parsed_questions = parsed
+
+            # The new turn is already drawn above, so only rerun when something
+            # outside it changed instead of re-emitting the whole history
+            if _sidebar_snapshot(cm) != sidebar_before:
+                st.rerun()
+            elif _show_question_form(cm):
+                st.rerun(scope="fragment")
+
+
 # ──────────────────────────────────────────────
 # Main Chat Interface
 # ──────────────────────────────────────────────
@@ -552,12 +476,7 @@ def main():
     render_sidebar()
 
     # Hero Header
-    st.markdown(f"""
-    <div class="hero-card">
-        <h1>{APP_ICON} {COMPANY_NAME}</h1>
-        <p>AI-Powered Technical Screening Assistant</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
 
     # API Key Setup (if not configured via .env)
     if not st.session_state.api_key_set:
@@ -576,13 +495,16 @@ def main():
             </div>
             """, unsafe_allow_html=True)
 
-            api_key = st.text_input(
-                "Groq API Key",
-                type="password",
-                placeholder="gsk_...",
-                label_visibility="collapsed",
-            )
-            if st.button("Start Screening", use_container_width=True):
+            # Form defers reruns until submit instead of one per keystroke/blur
+            with st.form("api_setup", clear_on_submit=False):
+                api_key = st.text_input(
+                    "Groq API Key",
+                    type="password",
+                    placeholder="gsk_...",
+                    label_visibility="collapsed",
+                )
+                submitted = st.form_submit_button("Start Screening", use_container_width=True)
+            if submitted:
                 if api_key.strip():
                     if start_conversation(api_key.strip()):
                         st.rerun()
@@ -608,66 +530,7 @@ def main():
             st.session_state.greeting_sent = True
             st.rerun()
 
-    # Display Chat History
-    for msg in st.session_state.chat_history:
-        avatar = "assistant" if msg["role"] == "assistant" else "user"
-        with st.chat_message(msg["role"]):
-            st.markdown(msg["content"])
-
-    # Check if we need to show question form
-    state = cm.get_state()
-    show_question_form = (
-        state in (ConversationState.TECH_QUESTIONS, ConversationState.ANSWERING_QUESTIONS)
-        and st.session_state.parsed_questions
-        and not st.session_state.questions_submitted
-    )
-
-    if show_question_form:
-        # Show individual answer boxes for each question
-        render_question_form()
-    elif cm.is_ended():
-        st.markdown("""
-        <div style="text-align: center; padding: 1rem; color: #94a3b8;">
-            <p>This screening session has ended. Click <strong>New Chat</strong> in the sidebar to start a new one.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    else:
-        if user_input := st.chat_input("Type your message here..."):
-            # Display user message
-            with st.chat_message("user"):
-                st.markdown(user_input)
-            st.session_state.chat_history.append({
-                "role": "user",
-                "content": user_input,
-            })
-
-            # Get bot response
-            with st.chat_message("assistant"):
-                with st.spinner("Thinking..."):
-                    response, sentiment = cm.process_message(user_input)
-                    st.markdown(response)
-
-            st.session_state.chat_history.append({
-                "role": "assistant",
-                "content": response,
-            })
-
-            if sentiment:
-                st.session_state.current_sentiment = sentiment
-
-            # Check if tech questions were just generated — parse them
-            # Must re-check state AFTER process_message since it may have changed
-            current_state = cm.get_state()
-            if (
-                current_state in (ConversationState.TECH_QUESTIONS, ConversationState.ANSWERING_QUESTIONS)
-                and not st.session_state.parsed_questions
-                and cm.raw_tech_questions
-            ):
-                parsed = parse_technical_questions(cm.raw_tech_questions)
-                if parsed:
-                    st.session_state.parsed_questions = parsed
-
-            st.rerun()
+    render_chat()
 
 
 if __name__ == "__main__":
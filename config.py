@@ -4,6 +4,7 @@ Contains all application constants, model settings, and conversation parameters.
 """
 
 import os
+import re
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,9 +14,34 @@ load_dotenv()
 # ──────────────────────────────────────────────
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 MODEL_NAME = "llama-3.3-70b-versatile"
+FAST_MODEL_NAME = "llama-3.1-8b-instant"  # Narrow JSON tasks: sentiment and field extraction
 TEMPERATURE = 0.7
 MAX_TOKENS = 1024
 
+# HTTP connection pool (one keep-alive pool shared by all sessions)
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_TIMEOUT = 30.0  # Seconds per read/write
+HTTP_CONNECT_TIMEOUT = 5.0
+
+# Failure handling: the SDK retries 429/5xx/connection errors with backoff,
+# and the breaker fails fast once upstream keeps failing
+LLM_MAX_RETRIES = 3
+CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive upstream failures before opening
+CIRCUIT_RESET_SECONDS = 30.0  # Cool-down before a trial call is let through
+
+# Response cache (shared across sessions, in memory only)
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 24 * 60 * 60  # Seconds
+CACHE_MAX_TEMPERATURE = 0.2  # Calls above this are too random to cache by default
+
+# Sliding window per phase, in turns (one user + one assistant message each).
+# Turns older than the window are folded into the running history summary
+INFO_GATHERING_MAX_TURNS = 4
+TECH_QA_MAX_TURNS = 8
+FALLBACK_MAX_TURNS = 3
+HISTORY_SUMMARY_BATCH_TURNS = 4  # Turns past the window that trigger a summary
+
 # ──────────────────────────────────────────────
 # Application Settings
 # ──────────────────────────────────────────────
@@ -23,16 +49,18 @@ APP_TITLE = "TalentScout — Hiring Assistant"
 APP_ICON = "🎯"
 COMPANY_NAME = "TalentScout"
 COMPANY_TAGLINE = "Intelligent Recruitment for Technology Placements"
+STREAM_FLUSH_INTERVAL = 0.05  # Seconds between UI updates while streaming (~20 Hz)
 
 # ──────────────────────────────────────────────
 # Conversation-Ending Keywords
 # ──────────────────────────────────────────────
-EXIT_KEYWORDS = {
+# Lowercased once here: build_exit_matcher() expects lowercase keywords
+EXIT_KEYWORDS = frozenset(k.lower() for k in (
     "bye", "goodbye", "exit", "quit", "end", "stop",
     "thanks bye", "thank you bye", "see you", "later",
     "done", "finish", "end conversation", "close",
     "no more", "that's all", "i'm done", "im done",
-}
+))
 
 # ──────────────────────────────────────────────
 # Candidate Information Fields
@@ -86,3 +114,23 @@ SENTIMENT_MAP = {
     "nervous": {"emoji": "😬", "color": "#fb923c"},
     "confident": {"emoji": "💪", "color": "#60a5fa"},
 }
+
+# ──────────────────────────────────────────────
+# Sentiment Fast Path (skips the LLM for obvious messages)
+# ──────────────────────────────────────────────
+SENTIMENT_LEXICON = {
+    "excited": ("excited", "thrilled", "can't wait", "cant wait", "stoked", "love", "amazing", "awesome"),
+    "nervous": ("nervous", "anxious", "worried", "scared", "afraid", "stressed", "not sure", "unsure"),
+    "confident": ("confident", "definitely", "absolutely", "certainly", "expert", "easily"),
+    "positive": ("great", "good", "happy", "glad", "thanks", "thank you", "perfect", "nice", "sounds good"),
+    "negative": ("bad", "annoyed", "frustrated", "upset", "hate", "terrible", "angry", "disappointed"),
+}
+SENTIMENT_PATTERNS = {
+    label: re.compile(
+        r"\b(?:" + "|".join(re.escape(w) for w in words) + r")\b", re.IGNORECASE
+    )
+    for label, words in SENTIMENT_LEXICON.items()
+}
+NEGATION_PATTERN = re.compile(r"\b(?:not|no|never|don't|dont|isn't|wasn't)\b|n't\b", re.IGNORECASE)
+SENTIMENT_FAST_PATH_MAX_WORDS = 6  # Short replies without emotion words are neutral
+
@@ -4,31 +4,51 @@ Manages the state machine, context injection, and message processing.
 """
 
 import logging
-from typing import List, Dict, Tuple, Optional
+import random
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Iterator, Tuple, Optional
 
-from config import EXIT_KEYWORDS, CANDIDATE_FIELDS
+from config import (
+    EXIT_KEYWORDS, SENTIMENT_MAP,
+    SENTIMENT_PATTERNS, NEGATION_PATTERN, SENTIMENT_FAST_PATH_MAX_WORDS,
+    INFO_GATHERING_MAX_TURNS, TECH_QA_MAX_TURNS, FALLBACK_MAX_TURNS,
+    HISTORY_SUMMARY_BATCH_TURNS,
+)
 from models import ConversationState, CandidateInfo
 from prompts import (
     SYSTEM_PROMPT,
+    CONTEXT_PROMPT,
+    TECH_QUESTIONS_CONTEXT,
     GREETING_PROMPT,
+    GREETING_SAMPLES,
     INFO_GATHERING_PROMPT,
+    EXTRACTION_PROMPT,
     TECH_QUESTIONS_PROMPT,
     FALLBACK_PROMPT,
     CLOSING_PROMPT,
     EXIT_DETECTED_PROMPT,
     SENTIMENT_PROMPT,
     EVALUATE_ANSWER_PROMPT,
+    SUMMARY_PROMPT,
+    HISTORY_SUMMARY_TEMPLATE,
 )
-from llm_client import LLMClient
+from llm_client import LLMClient, ERROR_RESPONSE
 from utils import (
     sanitize_input,
-    extract_json_from_response,
     strip_json_from_response,
+    build_exit_matcher,
     check_exit_intent,
+    classify_sentiment_fast,
 )
 
 logger = logging.getLogger(__name__)
 
+# Built once at import so check_exit_intent() does no per-call preprocessing
+_EXIT_MATCHER = build_exit_matcher(EXIT_KEYWORDS)
+
+# Shared pool so sentiment analysis and field extraction run alongside the main LLM call
+_background = ThreadPoolExecutor(max_workers=8, thread_name_prefix="talentscout")
+
 
 class ConversationManager:
     """
@@ -51,28 +71,69 @@ class ConversationManager:
         self.technical_questions_asked = False
         self.current_sentiment = "neutral"
         self.raw_tech_questions = ""  # Store raw questions text for UI parsing
+        self.candidate_version = 0  # Bumped whenever a candidate field changes
+        self._candidate_dict_cache: Optional[dict] = None
+        self._context_prompt_cache: Optional[Tuple[tuple, str]] = None
+        self._history_summary: Optional[str] = None  # Summary of messages before _summary_offset
+        self._summary_offset = 0
+        self._summary_job: Optional[Tuple[Future, int]] = None  # In-flight summary and its cut
+        self._extracted_sentiment = "neutral"  # Reported by the extraction call
+
+    # Static per-state guidance; GATHERING_INFO is built per call from the field status
+    _STATE_DESCRIPTIONS = {
+        ConversationState.GREETING: "You are greeting the candidate for the first time. Welcome them and ask for their name.",
+        ConversationState.TECH_QUESTIONS: "You have collected all candidate info and are now presenting technical screening questions based on their tech stack.",
+        ConversationState.ANSWERING_QUESTIONS: "The candidate is answering technical questions. Evaluate their responses and guide them through the remaining questions.",
+        ConversationState.CLOSING: "The screening is complete. Thank the candidate and inform them about next steps.",
+        ConversationState.ENDED: "The conversation has ended.",
+    }
 
-    def _build_system_prompt(self) -> str:
-        """Build the system prompt with current context injected."""
-        state_descriptions = {
-            ConversationState.GREETING: "You are greeting the candidate for the first time. Welcome them and ask for their name.",
-            ConversationState.GATHERING_INFO: f"You are collecting candidate information. Missing fields: {', '.join(self.candidate.get_missing_fields())}. Collected: {self.candidate.get_filled_fields()}",
-            ConversationState.TECH_QUESTIONS: "You have collected all candidate info and are now presenting technical screening questions based on their tech stack.",
-            ConversationState.ANSWERING_QUESTIONS: "The candidate is answering technical questions. Evaluate their responses and guide them through the remaining questions.",
-            ConversationState.CLOSING: "The screening is complete. Thank the candidate and inform them about next steps.",
-            ConversationState.ENDED: "The conversation has ended.",
-        }
-        return SYSTEM_PROMPT.format(
-            state_context=state_descriptions.get(self.state, ""),
+    # Turns each phase keeps verbatim; any other state is handled as fallback
+    _HISTORY_WINDOWS = {
+        ConversationState.GATHERING_INFO: INFO_GATHERING_MAX_TURNS,
+        ConversationState.TECH_QUESTIONS: TECH_QA_MAX_TURNS,
+        ConversationState.ANSWERING_QUESTIONS: TECH_QA_MAX_TURNS,
+    }
+
+    def _build_context_prompt(self) -> str:
+        """
+        Build the per-turn context (state + candidate) sent after the conversation.
+        Memoized on (state, candidate_version), so repeated calls within a turn are free.
+        """
+        key = (self.state, self.candidate_version)
+        if self._context_prompt_cache and self._context_prompt_cache[0] == key:
+            return self._context_prompt_cache[1]
+
+        if self.state == ConversationState.GATHERING_INFO:
+            state_context = f"You are collecting candidate information. {self._field_status()}"
+        else:
+            state_context = self._STATE_DESCRIPTIONS.get(self.state, "")
+        prompt = CONTEXT_PROMPT.format(
+            state_context=state_context,
             candidate_context=self.candidate.get_summary(),
         )
+        self._context_prompt_cache = (key, prompt)
+        return prompt
+
+    def _field_status(self) -> str:
+        """Compact one-line status of collected and missing candidate fields."""
+        collected = ", ".join(f"{f}={v}" for f, v in self.candidate.get_filled_fields().items())
+        missing = ", ".join(self.candidate.get_missing_fields())
+        return f"Collected: {collected or 'none'}. Missing: {missing or 'none'}."
 
     def generate_greeting(self) -> str:
         """Generate the initial greeting message."""
-        response = self.llm.get_chat_response(
-            messages=[{"role": "user", "content": GREETING_PROMPT}],
-            system_prompt=self._build_system_prompt(),
-        )
+        if GREETING_SAMPLES:
+            # Pre-written greetings avoid an API round trip on session start
+            response = random.choice(GREETING_SAMPLES)
+        else:
+            # The greeting prompt never changes, so it is safe to cache despite its temperature
+            response = self.llm.get_chat_response(
+                messages=[{"role": "user", "content": GREETING_PROMPT}],
+                system_prompt=SYSTEM_PROMPT,
+                context_prompt=self._build_context_prompt(),
+                cache=True,
+            )
         self.state = ConversationState.GATHERING_INFO
         self.messages.append({"role": "assistant", "content": response})
         return response
@@ -87,61 +148,153 @@ class ConversationManager:
         Returns:
             Tuple of (response_text, sentiment_label or None)
         """
+        response = "".join(self.stream_message(user_message))
+        return response, self.current_sentiment
+
+    def stream_message(self, user_message: str) -> Iterator[str]:
+        """
+        Process a user message and stream the response back in chunks.
+        The full response is recorded in the history once the stream is
+        exhausted; the detected sentiment is left in ``current_sentiment``.
+        
+        Args:
+            user_message: The candidate's input text
+        
+        Yields:
+            Chunks of the response text
+        """
         # Sanitize input
         user_message = sanitize_input(user_message)
         
         # Record the user message
         self.messages.append({"role": "user", "content": user_message})
+        self._apply_history_summary()
 
         # Check for exit intent at ANY stage
-        if check_exit_intent(user_message, EXIT_KEYWORDS):
-            return self._handle_exit(), self.current_sentiment
+        if check_exit_intent(user_message, _EXIT_MATCHER):
+            yield from self._stream_exit()
+            return
 
-        # Analyze sentiment (bonus feature)
-        sentiment_label = self._analyze_sentiment(user_message)
+        # Analyze sentiment (bonus feature): obvious messages are classified locally.
+        # During info gathering the extraction call reports it; otherwise it goes
+        # to the LLM concurrently with the main response
+        sentiment = classify_sentiment_fast(
+            user_message, SENTIMENT_PATTERNS, NEGATION_PATTERN, SENTIMENT_FAST_PATH_MAX_WORDS
+        )
+        sentiment_future = None
+        if not sentiment and self.state != ConversationState.GATHERING_INFO:
+            sentiment_future = _background.submit(self._analyze_sentiment, user_message)
 
         # Route to appropriate handler based on state
         if self.state == ConversationState.GATHERING_INFO:
-            response = self._handle_info_gathering(user_message)
+            chunks = self._stream_info_gathering()
         elif self.state in (ConversationState.TECH_QUESTIONS, ConversationState.ANSWERING_QUESTIONS):
-            response = self._handle_tech_interaction(user_message)
+            chunks = self._stream_tech_interaction()
         elif self.state == ConversationState.CLOSING:
-            response = self._handle_closing()
+            chunks = self._stream_closing()
         else:
-            response = self._handle_fallback(user_message)
+            chunks = self._stream_fallback(user_message)
+
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+
+        if not sentiment:
+            sentiment = sentiment_future.result() if sentiment_future else self._extracted_sentiment
+        self.current_sentiment = sentiment
 
         # Record assistant response
-        self.messages.append({"role": "assistant", "content": response})
-        return response, sentiment_label
+        self.messages.append({"role": "assistant", "content": "".join(parts)})
+        self._compact_history()
 
-    def _handle_info_gathering(self, user_message: str) -> str:
+    def _recent(self) -> List[Dict[str, str]]:
         """
-        Handle messages during the information gathering phase.
-        Uses LLM to extract structured data from conversational input.
+        Build the history sent to the LLM: the running summary (if any)
+        followed by every message that has not been summarized yet.
+        _compact_history() keeps the unsummarized part close to the
+        current phase's window, so prompt size stays flat.
+        """
+        recent = self.messages[self._summary_offset:]
+        if self._history_summary is None:
+            return recent
+        summary = HISTORY_SUMMARY_TEMPLATE.format(summary=self._history_summary)
+        return [{"role": "system", "content": summary}] + recent
+
+    def _compact_history(self) -> None:
+        """
+        Fold the messages before the current phase's window into the running
+        summary once HISTORY_SUMMARY_BATCH_TURNS more turns have built up.
+        The summary always sits right after the system prompt, so only the
+        tail of the request changes. It is generated in the background and
+        applied on the next turn.
         """
-        # Build the info gathering prompt with current field status
-        field_status = {}
-        for field in CANDIDATE_FIELDS:
-            value = getattr(self.candidate, field)
-            field_status[field] = value if value else "❌ Not yet collected"
+        if self._summary_job is not None:
+            return
+        window = 2 * self._HISTORY_WINDOWS.get(self.state, FALLBACK_MAX_TURNS)
+        pending = len(self.messages) - self._summary_offset
+        if pending < window + 2 * HISTORY_SUMMARY_BATCH_TURNS:
+            return
 
-        prompt = INFO_GATHERING_PROMPT.format(**field_status)
+        cut = pending - window
+        # The previous summary is included so nothing older is lost
+        older = self._recent()[: cut + (self._history_summary is not None)]
+        future = _background.submit(self.llm.summarize_conversation, older, SUMMARY_PROMPT)
+        self._summary_job = (future, cut)
 
-        # Get LLM response with full conversation context
+    def _apply_history_summary(self) -> None:
+        """
+        Install the background summary if it has finished. Until then the
+        full unsummarized history is sent, so a slow summary never blocks a turn.
+        """
+        if self._summary_job is None or not self._summary_job[0].done():
+            return
+        future, cut = self._summary_job
+        self._summary_job = None
+        try:
+            summary = future.result()
+        except Exception as e:
+            logger.warning(f"History summary failed: {e}")
+            return
+        if not summary or summary == ERROR_RESPONSE:
+            logger.warning("History summary failed; will retry after the next turn")
+            return
+
+        self._history_summary = summary.strip()
+        self._summary_offset += cut
+
+    def _stream_info_gathering(self) -> Iterator[str]:
+        """
+        Handle messages during the information gathering phase.
+        The conversational reply and the structured field extraction are
+        separate LLM calls issued in parallel. The reply is yielded whole
+        (it may need a JSON block stripped); technical questions generated
+        on completion are streamed after it.
+        """
+        # Extract fields through a JSON-mode call while the reply is generated
+        history = self._recent()
+        extraction_future = _background.submit(
+            self.llm.extract_candidate_info, list(history), EXTRACTION_PROMPT
+        )
+
+        # Get LLM response with the recent conversation context
         response = self.llm.get_chat_response(
-            messages=self.messages,
-            system_prompt=self._build_system_prompt() + "\n\n" + prompt,
+            messages=history,
+            system_prompt=SYSTEM_PROMPT,
+            context_prompt=self._build_context_prompt() + "\n\n" + INFO_GATHERING_PROMPT,
         )
 
-        # Extract structured data from LLM response
-        extracted_json = extract_json_from_response(response)
+        # Apply the structured data extracted from the conversation
+        extracted_json = extraction_future.result()
+        label = (extracted_json or {}).get("sentiment")
+        self._extracted_sentiment = label if label in SENTIMENT_MAP else "neutral"
         if extracted_json and "extracted" in extracted_json:
             extracted = extracted_json["extracted"]
             for field, value in extracted.items():
                 if value and value != "null" and hasattr(self.candidate, field):
                     current = getattr(self.candidate, field)
                     if current is None:
-                        setattr(self.candidate, field, str(value))
+                        self._set_candidate_field(field, str(value))
 
             # Check if all info is collected
             if extracted_json.get("all_collected") or self.candidate.is_complete():
@@ -151,22 +304,29 @@ class ConversationManager:
         if self.candidate.is_complete() and self.state != ConversationState.TECH_QUESTIONS:
             self.state = ConversationState.TECH_QUESTIONS
 
-        # Clean response for display (remove JSON block)
-        clean_response = strip_json_from_response(response)
+        # Clean response for display, in case the model still appended a JSON block
+        yield strip_json_from_response(response).rstrip()
         
-        # If we just transitioned to tech questions, generate them
+        # If we just transitioned to tech questions, stream them after the reply
         if self.state == ConversationState.TECH_QUESTIONS and not self.technical_questions_asked:
-            tech_questions = self._generate_tech_questions()
-            self.raw_tech_questions = tech_questions  # Store for UI parsing
-            clean_response = clean_response.rstrip() + "\n\n" + tech_questions
+            yield "\n\n"
+            parts = []
+            for chunk in self._stream_tech_questions():
+                parts.append(chunk)
+                yield chunk
+            self.raw_tech_questions = "".join(parts)  # Store for UI parsing
             self.technical_questions_asked = True
             self.state = ConversationState.ANSWERING_QUESTIONS
 
-        return clean_response
+    def _set_candidate_field(self, field: str, value: str) -> None:
+        """Set a candidate field and invalidate cached views of the candidate."""
+        setattr(self.candidate, field, value)
+        self.candidate_version += 1
+        self._candidate_dict_cache = None
 
-    def _generate_tech_questions(self) -> str:
-        """Generate technical screening questions based on the candidate's tech stack."""
-        return self.llm.generate_technical_questions(
+    def _stream_tech_questions(self) -> Iterator[str]:
+        """Stream technical screening questions based on the candidate's tech stack."""
+        return self.llm.stream_technical_questions(
             tech_stack=self.candidate.tech_stack or "General Programming",
             name=self.candidate.full_name or "Candidate",
             experience=self.candidate.years_of_experience or "Unknown",
@@ -174,29 +334,32 @@ class ConversationManager:
             prompt_template=TECH_QUESTIONS_PROMPT,
         )
 
-    def _handle_tech_interaction(self, user_message: str) -> str:
-        """Handle messages during the technical Q&A phase."""
-        # Use the full conversation context so the LLM knows which questions were asked
-        response = self.llm.get_chat_response(
-            messages=self.messages,
-            system_prompt=self._build_system_prompt(),
+    def _stream_tech_interaction(self) -> Iterator[str]:
+        """Stream the response to a message during the technical Q&A phase."""
+        # The question list is re-sent so it survives the sliding window
+        context_prompt = self._build_context_prompt()
+        if self.raw_tech_questions:
+            context_prompt += "\n" + TECH_QUESTIONS_CONTEXT.format(questions=self.raw_tech_questions)
+        return self.llm.get_chat_response_stream(
+            messages=self._recent(),
+            system_prompt=SYSTEM_PROMPT,
+            context_prompt=context_prompt,
         )
-        return response
 
-    def _handle_closing(self) -> str:
-        """Generate the closing message."""
+    def _stream_closing(self) -> Iterator[str]:
+        """Stream the closing message."""
         prompt = CLOSING_PROMPT.format(
             name=self.candidate.full_name or "there",
             positions=self.candidate.desired_positions or "the position",
         )
-        response = self.llm.get_chat_response(
+        yield from self.llm.get_chat_response_stream(
             messages=[{"role": "user", "content": prompt}],
-            system_prompt=self._build_system_prompt(),
+            system_prompt=SYSTEM_PROMPT,
+            context_prompt=self._build_context_prompt(),
         )
         self.state = ConversationState.ENDED
-        return response
 
-    def _handle_exit(self) -> str:
+    def _stream_exit(self) -> Iterator[str]:
         """Handle when the candidate wants to end the conversation."""
         info_status = (
             "Complete" if self.candidate.is_complete()
@@ -206,34 +369,33 @@ class ConversationManager:
             name=self.candidate.full_name or "there",
             info_status=info_status,
         )
-        response = self.llm.get_chat_response(
+        yield from self.llm.get_chat_response_stream(
             messages=[{"role": "user", "content": prompt}],
-            system_prompt=self._build_system_prompt(),
+            system_prompt=SYSTEM_PROMPT,
+            context_prompt=self._build_context_prompt(),
         )
         self.state = ConversationState.ENDED
-        return response
 
-    def _handle_fallback(self, user_message: str) -> str:
+    def _stream_fallback(self, user_message: str) -> Iterator[str]:
         """Handle unexpected or off-topic messages."""
         prompt = FALLBACK_PROMPT.format(
             message=user_message,
             state=self.state.value,
         )
-        response = self.llm.get_chat_response(
-            messages=self.messages[-6:],  # Last 3 exchanges for context
-            system_prompt=self._build_system_prompt() + "\n\n" + prompt,
+        return self.llm.get_chat_response_stream(
+            messages=self._recent(),
+            system_prompt=SYSTEM_PROMPT,
+            context_prompt=self._build_context_prompt() + "\n\n" + prompt,
         )
-        return response
 
     def _analyze_sentiment(self, message: str) -> str:
         """
         Analyze the sentiment of the candidate's message.
-        Returns the sentiment label.
+        Returns the sentiment label. Runs on a worker thread, so it must
+        not touch conversation state.
         """
         try:
-            result = self.llm.analyze_sentiment(message, SENTIMENT_PROMPT)
-            self.current_sentiment = result.sentiment
-            return result.sentiment
+            return self.llm.analyze_sentiment(message, SENTIMENT_PROMPT).sentiment
         except Exception:
             return "neutral"
 
@@ -245,6 +407,16 @@ class ConversationManager:
         """Get current candidate information."""
         return self.candidate
 
+    def get_candidate_info_dict(self) -> dict:
+        """
+        Get current candidate information as a dict.
+        The dict is cached and only rebuilt after a field changes,
+        so callers must treat it as read-only.
+        """
+        if self._candidate_dict_cache is None:
+            self._candidate_dict_cache = self.candidate.to_dict()
+        return self._candidate_dict_cache
+
     def get_messages(self) -> List[Dict[str, str]]:
         """Get full message history."""
         return self.messages
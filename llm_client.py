@@ -4,24 +4,95 @@ Handles all interactions with the Groq API (Llama 3.3 70B).
 """
 
 import json
+import hashlib
 import logging
-from typing import List, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Iterator, Optional, Tuple
 
-from groq import Groq
+import httpx
+from groq import Groq, APIConnectionError, InternalServerError
 
-from config import GROQ_API_KEY, MODEL_NAME, TEMPERATURE, MAX_TOKENS
+from config import (
+    GROQ_API_KEY, MODEL_NAME, FAST_MODEL_NAME, TEMPERATURE, MAX_TOKENS,
+    RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL, CACHE_MAX_TEMPERATURE,
+    HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS, HTTP_TIMEOUT, HTTP_CONNECT_TIMEOUT,
+    LLM_MAX_RETRIES, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SECONDS,
+)
 from models import SentimentResult
+from utils import extract_json_from_response, loads_json, dumps_canonical
 
 logger = logging.getLogger(__name__)
 
+ERROR_RESPONSE = (
+    "I apologize, but I'm experiencing a brief technical issue. "
+    "Could you please repeat your last message? I want to make sure "
+    "I capture everything correctly. 🙏"
+)
+
+# Errors that mean the API itself is unhealthy (after the SDK's own retries)
+UPSTREAM_ERRORS = (InternalServerError, APIConnectionError)
+
+
+class CircuitBreaker:
+    """
+    Fails fast after repeated upstream failures instead of making every
+    turn wait out the full retry budget. After a cool-down one trial call
+    is let through; a single further failure opens the breaker again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return whether a call may be attempted right now."""
+        with self._lock:
+            if self._trial_in_flight:
+                return False
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                return False
+            # Half-open: admit exactly one trial call until its outcome is recorded
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
 
 class LLMClient:
     """
     Wrapper around the Groq SDK for chat completions.
     Provides methods for general chat, technical question generation,
     and sentiment analysis.
+
+    Responses to cacheable calls are kept in an LRU cache shared by all
+    instances, so repeated prompts across sessions skip the network.
     """
 
+    _cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    _http_client: Optional[httpx.Client] = None
+    _http_lock = threading.Lock()
+    _breaker = CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SECONDS)
+
     def __init__(self, api_key: str = None):
         """
         Initialize the Groq client.
@@ -35,8 +106,37 @@ class LLMClient:
                 "GROQ_API_KEY not found. Please set it in your .env file "
                 "or pass it directly. Get a free key at https://console.groq.com"
             )
-        self.client = Groq(api_key=self.api_key)
+        self.client = Groq(
+            api_key=self.api_key,
+            http_client=self._shared_http_client(),
+            max_retries=LLM_MAX_RETRIES,  # Exponential backoff with jitter, honours Retry-After
+        )
         self.model = MODEL_NAME
+        self.fast_model = FAST_MODEL_NAME
+
+    @classmethod
+    def _shared_http_client(cls) -> httpx.Client:
+        """
+        Return the keep-alive HTTP pool shared by all clients, so new
+        sessions and parallel calls reuse open TLS connections.
+        HTTP/2 is used when the optional h2 package is installed.
+        """
+        with cls._http_lock:
+            if cls._http_client is None:
+                try:
+                    import h2  # noqa: F401
+                    http2 = True
+                except ImportError:
+                    http2 = False
+                cls._http_client = httpx.Client(
+                    http2=http2,
+                    limits=httpx.Limits(
+                        max_connections=HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    ),
+                    timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+                )
+            return cls._http_client
 
     def get_chat_response(
         self,
@@ -44,6 +144,10 @@ class LLMClient:
         system_prompt: str = "",
         temperature: float = TEMPERATURE,
         max_tokens: int = MAX_TOKENS,
+        cache: Optional[bool] = None,
+        context_prompt: str = "",
+        json_mode: bool = False,
+        model: Optional[str] = None,
     ) -> str:
         """
         Send a chat completion request to the Groq API.
@@ -53,34 +157,174 @@ class LLMClient:
             system_prompt: System-level instruction for the model
             temperature: Sampling temperature (0.0 - 1.0)
             max_tokens: Maximum tokens in the response
+            cache: Whether to serve/store the response from the response cache.
+                Defaults to caching only low-temperature calls.
+            context_prompt: Per-turn system instructions, sent after the messages
+            json_mode: Constrain the output to a single valid JSON object
+            model: Model to use instead of the default conversational model
         
         Returns:
             The assistant's response text
         """
-        try:
-            full_messages = []
-            if system_prompt:
-                full_messages.append({
-                    "role": "system",
-                    "content": system_prompt
-                })
-            full_messages.extend(messages)
+        model = model or self.model
+        full_messages = self._build_messages(messages, system_prompt, context_prompt)
+        if cache is None:
+            cache = temperature <= CACHE_MAX_TEMPERATURE
+        key = self._cache_key(full_messages, temperature, max_tokens, json_mode, model) if cache else None
+        if key:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        if not self._breaker.allow():
+            logger.warning("LLM circuit open; skipping API call")
+            return ERROR_RESPONSE
 
+        try:
+            extra = {"response_format": {"type": "json_object"}} if json_mode else {}
             response = self.client.chat.completions.create(
-                model=self.model,
+                model=model,
                 messages=full_messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                **extra,
             )
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
 
         except Exception as e:
-            logger.error(f"LLM API error: {e}")
-            return (
-                "I apologize, but I'm experiencing a brief technical issue. "
-                "Could you please repeat your last message? I want to make sure "
-                "I capture everything correctly. 🙏"
+            self._record_error(e)
+            return ERROR_RESPONSE
+
+        self._breaker.record_success()
+
+        if key:
+            self._cache_put(key, content)
+        return content
+
+    def get_chat_response_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: str = "",
+        temperature: float = TEMPERATURE,
+        max_tokens: int = MAX_TOKENS,
+        context_prompt: str = "",
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion from the Groq API as it is generated.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            system_prompt: System-level instruction for the model
+            temperature: Sampling temperature (0.0 - 1.0)
+            max_tokens: Maximum tokens in the response
+            context_prompt: Per-turn system instructions, sent after the messages
+        
+        Yields:
+            Chunks of the assistant's response text as they arrive
+        """
+        if not self._breaker.allow():
+            logger.warning("LLM circuit open; skipping API call")
+            yield ERROR_RESPONSE
+            return
+
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(messages, system_prompt, context_prompt),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
             )
+            # Recorded once the stream opens, so a consumer that stops reading
+            # early cannot leave a half-open trial in flight
+            self._breaker.record_success()
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            self._record_error(e)
+            yield ERROR_RESPONSE
+
+    def _record_error(self, error: Exception) -> None:
+        """Log a failed call and count it toward the circuit breaker if upstream is at fault."""
+        logger.error(f"LLM API error: {error}")
+        if isinstance(error, UPSTREAM_ERRORS):
+            self._breaker.record_failure()
+        else:
+            # The API answered (e.g. a 4xx), so upstream is healthy; this also
+            # ends a half-open trial instead of leaving it in flight
+            self._breaker.record_success()
+
+    @staticmethod
+    def _build_messages(
+        messages: List[Dict[str, str]], system_prompt: str, context_prompt: str = ""
+    ) -> List[Dict[str, str]]:
+        """
+        Assemble the request as: static system prompt, conversation, per-turn context.
+        Keeping the changing context last leaves the longest possible stable
+        prefix for provider-side prompt caching.
+        """
+        full_messages = []
+        if system_prompt:
+            full_messages.append({
+                "role": "system",
+                "content": system_prompt
+            })
+        full_messages.extend(messages)
+        if context_prompt:
+            full_messages.append({
+                "role": "system",
+                "content": context_prompt
+            })
+        return full_messages
+
+    def _cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool = False,
+        model: Optional[str] = None,
+    ) -> str:
+        """Hash everything that determines a completion into a cache key."""
+        payload = dumps_canonical({
+            "model": model or self.model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "json_mode": json_mode,
+            "messages": messages,
+        })
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    @classmethod
+    def _cache_get(cls, key: str) -> Optional[str]:
+        """Return a cached response, or None if missing or expired."""
+        with cls._cache_lock:
+            entry = cls._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, content = entry
+            if time.monotonic() - stored_at > RESPONSE_CACHE_TTL:
+                del cls._cache[key]
+                return None
+            cls._cache.move_to_end(key)
+            return content
+
+    @classmethod
+    def _cache_put(cls, key: str, content: str) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        with cls._cache_lock:
+            cls._cache[key] = (time.monotonic(), content)
+            cls._cache.move_to_end(key)
+            while len(cls._cache) > RESPONSE_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop every cached response."""
+        with cls._cache_lock:
+            cls._cache.clear()
 
     def generate_technical_questions(
         self,
@@ -103,6 +347,25 @@ class LLMClient:
         Returns:
             Formatted technical questions
         """
+        return "".join(self.stream_technical_questions(
+            tech_stack, name, experience, positions, prompt_template
+        ))
+
+    def stream_technical_questions(
+        self,
+        tech_stack: str,
+        name: str,
+        experience: str,
+        positions: str,
+        prompt_template: str,
+    ) -> Iterator[str]:
+        """
+        Stream tailored technical questions as they are generated.
+        Takes the same arguments as generate_technical_questions().
+        
+        Yields:
+            Chunks of the formatted technical questions
+        """
         prompt = prompt_template.format(
             name=name,
             experience=experience,
@@ -110,12 +373,57 @@ class LLMClient:
             tech_stack=tech_stack,
         )
         messages = [{"role": "user", "content": prompt}]
-        return self.get_chat_response(
+        return self.get_chat_response_stream(
             messages=messages,
             temperature=0.6,  # Slightly lower for more focused questions
             max_tokens=2048,  # Allow longer response for multiple tech stacks
         )
 
+    def summarize_conversation(self, messages: List[Dict[str, str]], prompt_template: str) -> str:
+        """
+        Condense older conversation messages into a short summary.
+        Runs on the fast model; at 0.3 it stays out of the response cache.
+        
+        Args:
+            messages: The messages to summarize, oldest first
+            prompt_template: The summary prompt template
+        
+        Returns:
+            The summary text, or ERROR_RESPONSE if the call failed
+        """
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        return self.get_chat_response(
+            messages=[{"role": "user", "content": prompt_template.format(transcript=transcript)}],
+            temperature=0.3,
+            max_tokens=400,
+            model=self.fast_model,
+        )
+
+    def extract_candidate_info(
+        self, messages: List[Dict[str, str]], prompt_template: str
+    ) -> Optional[dict]:
+        """
+        Extract structured candidate fields from the conversation.
+        Uses JSON mode so the reply shown to the candidate carries no JSON.
+        
+        Args:
+            messages: The conversation so far
+            prompt_template: The extraction prompt (used as the system prompt)
+        
+        Returns:
+            Dict with 'extracted' and 'all_collected' keys, or None on failure
+        """
+        response = self.get_chat_response(
+            messages=messages,
+            system_prompt=prompt_template,
+            temperature=0.0,  # Deterministic extraction
+            max_tokens=300,
+            json_mode=True,
+            cache=False,  # Output is the candidate's PII; never keep it in the shared cache
+            model=self.fast_model,
+        )
+        return extract_json_from_response(response)
+
     def analyze_sentiment(self, message: str, prompt_template: str) -> SentimentResult:
         """
         Analyze the emotional tone of a candidate's message.
@@ -131,11 +439,13 @@ class LLMClient:
             prompt = prompt_template.format(message=message)
             response = self.get_chat_response(
                 messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,  # Low temperature for consistent classification
+                temperature=0.0,  # Deterministic, so repeated inputs hit the cache
                 max_tokens=100,
+                json_mode=True,
+                model=self.fast_model,
             )
             # Parse the JSON response
-            data = json.loads(response.strip())
+            data = loads_json(response.strip())
             return SentimentResult(
                 sentiment=data.get("sentiment", "neutral"),
                 confidence=data.get("confidence", 0.5),
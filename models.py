@@ -1,10 +1,11 @@
 """
 Data models for TalentScout Hiring Assistant.
-Defines Pydantic models for candidate information and conversation state.
+Defines data models for candidate information and conversation state.
 """
 
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List
+from typing import ClassVar, NamedTuple, Optional, List, Tuple
 from pydantic import BaseModel, EmailStr, Field
 
 
@@ -18,59 +19,97 @@ class ConversationState(str, Enum):
     ENDED = "ended"
 
 
-class CandidateInfo(BaseModel):
+@dataclass
+class CandidateInfo:
     """
     Structured model for candidate information collected during screening.
     All fields start as None and are populated as the conversation progresses.
+    A plain dataclass, since it is mutated field by field on every turn;
+    validation happens once at export via CandidateInfoValidated.
     """
-    full_name: Optional[str] = Field(None, description="Candidate's full name")
-    email: Optional[str] = Field(None, description="Candidate's email address")
-    phone: Optional[str] = Field(None, description="Candidate's phone number")
-    years_of_experience: Optional[str] = Field(None, description="Years of professional experience")
-    desired_positions: Optional[str] = Field(None, description="Position(s) the candidate is applying for")
-    current_location: Optional[str] = Field(None, description="Candidate's current city/country")
-    tech_stack: Optional[str] = Field(None, description="Technologies, languages, frameworks, tools")
+    full_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    years_of_experience: Optional[str] = None
+    desired_positions: Optional[str] = None
+    current_location: Optional[str] = None
+    tech_stack: Optional[str] = None
+
+    FIELD_NAMES: ClassVar[Tuple[str, ...]] = (
+        "full_name", "email", "phone", "years_of_experience",
+        "desired_positions", "current_location", "tech_stack",
+    )
+    SUMMARY_LABELS: ClassVar[dict] = {
+        "full_name": "👤 Name",
+        "email": "📧 Email",
+        "phone": "📱 Phone",
+        "years_of_experience": "📅 Experience",
+        "desired_positions": "💼 Position(s)",
+        "current_location": "📍 Location",
+        "tech_stack": "🛠️ Tech Stack",
+    }
+
+    _summary: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        """Invalidate the cached summary whenever a candidate field changes."""
+        super().__setattr__(name, value)
+        if name in self.FIELD_NAMES:
+            self._summary = None
 
     def get_filled_fields(self) -> dict:
         """Return only the fields that have been filled in."""
-        return {k: v for k, v in self.model_dump().items() if v is not None}
+        return {
+            f: v for f in self.FIELD_NAMES if (v := getattr(self, f)) is not None
+        }
 
     def get_missing_fields(self) -> list:
         """Return the names of fields that still need to be collected."""
-        return [k for k, v in self.model_dump().items() if v is None]
+        return [f for f in self.FIELD_NAMES if getattr(self, f) is None]
 
     def is_complete(self) -> bool:
         """Check if all required fields have been collected."""
-        return len(self.get_missing_fields()) == 0
+        return all(getattr(self, f) is not None for f in self.FIELD_NAMES)
 
     def get_completion_percentage(self) -> int:
         """Return the percentage of fields that have been filled."""
-        total = len(self.model_dump())
-        filled = len(self.get_filled_fields())
-        return int((filled / total) * 100)
+        filled = sum(getattr(self, f) is not None for f in self.FIELD_NAMES)
+        return int((filled / len(self.FIELD_NAMES)) * 100)
 
     def get_summary(self) -> str:
-        """Generate a human-readable summary of collected information."""
-        lines = []
-        field_labels = {
-            "full_name": "👤 Name",
-            "email": "📧 Email",
-            "phone": "📱 Phone",
-            "years_of_experience": "📅 Experience",
-            "desired_positions": "💼 Position(s)",
-            "current_location": "📍 Location",
-            "tech_stack": "🛠️ Tech Stack",
-        }
-        for field, label in field_labels.items():
-            value = getattr(self, field)
-            if value:
-                lines.append(f"**{label}**: {value}")
-            else:
-                lines.append(f"**{label}**: _Pending..._")
-        return "\n".join(lines)
+        """Generate a human-readable summary of collected information (cached until a field changes)."""
+        if self._summary is None:
+            lines = []
+            for field, label in self.SUMMARY_LABELS.items():
+                value = getattr(self, field)
+                if value:
+                    lines.append(f"**{label}**: {value}")
+                else:
+                    lines.append(f"**{label}**: _Pending..._")
+            self._summary = "\n".join(lines)
+        return self._summary
+
+    def to_dict(self) -> dict:
+        """Return the candidate fields as a plain dict."""
+        return {f: getattr(self, f) for f in self.FIELD_NAMES}
+
+    def to_validated_dict(self) -> dict:
+        """Validate the candidate fields through CandidateInfoValidated, for export."""
+        return CandidateInfoValidated(**self.to_dict()).model_dump()
+
+
+class CandidateInfoValidated(BaseModel):
+    """Pydantic view of CandidateInfo, used only at the serialization boundary."""
+    full_name: Optional[str] = Field(None, description="Candidate's full name")
+    email: Optional[str] = Field(None, description="Candidate's email address")
+    phone: Optional[str] = Field(None, description="Candidate's phone number")
+    years_of_experience: Optional[str] = Field(None, description="Years of professional experience")
+    desired_positions: Optional[str] = Field(None, description="Position(s) the candidate is applying for")
+    current_location: Optional[str] = Field(None, description="Candidate's current city/country")
+    tech_stack: Optional[str] = Field(None, description="Technologies, languages, frameworks, tools")
 
 
-class SentimentResult(BaseModel):
+class SentimentResult(NamedTuple):
     """Result of sentiment analysis on a candidate's message."""
     sentiment: str = "neutral"
     confidence: float = 0.5
@@ -46,14 +46,41 @@ SYSTEM_PROMPT = """You are **TalentBot**, a professional and friendly AI Hiring
 ## Data Privacy
 - Reassure candidates that their data is handled securely and in compliance with GDPR
 - Only collect information relevant to the hiring process
+"""
 
-## Current Conversation State
+# ──────────────────────────────────────────────
+# Per-Turn Context (sent after the conversation)
+# ──────────────────────────────────────────────
+# Kept out of SYSTEM_PROMPT so that prompt stays byte-identical across calls
+# and the provider can reuse its cached prefix.
+CONTEXT_PROMPT = """## Current Conversation State
 {state_context}
 
 ## Candidate Information Collected So Far
 {candidate_context}
 """
 
+TECH_QUESTIONS_CONTEXT = """## Technical Questions Asked
+{questions}
+"""
+
+# ──────────────────────────────────────────────
+# Conversation History Summary
+# ──────────────────────────────────────────────
+SUMMARY_PROMPT = """Summarize the following part of a recruitment screening conversation so it can replace the original messages.
+
+Keep:
+- Every candidate detail that was provided (name, contact info, experience, positions, location, tech stack)
+- Every technical question that was asked, and a one-line gist of the candidate's answer if one was given
+- Any open question the assistant is still waiting on
+
+Write concise bullet points in English. Do not add commentary.
+
+**Conversation**:
+{transcript}"""
+
+HISTORY_SUMMARY_TEMPLATE = "<conversation-summary>\n{summary}\n</conversation-summary>"
+
 # ──────────────────────────────────────────────
 # Greeting Prompt
 # ──────────────────────────────────────────────
@@ -68,34 +95,69 @@ Include:
 
 Keep it concise (3-5 sentences). Use a professional but approachable tone."""
 
+# Pre-written greetings that follow GREETING_PROMPT, so a new session can
+# start without waiting on the API. One is picked at random per session.
+GREETING_SAMPLES = [
+    "Welcome to TalentScout! 👋 I'm **TalentBot**, your AI hiring assistant. "
+    "I'll run a short initial screening for our technology positions by collecting a few details "
+    "and asking some questions about your tech stack. Everything you share is kept confidential "
+    "and used only for recruitment. To get started, could you please tell me your full name?",
+
+    "Hi there, and thanks for stopping by TalentScout! I'm **TalentBot**, the assistant that handles "
+    "initial screenings for our tech roles. Your information stays private and is only used for this "
+    "recruitment process. Let's begin — what's your full name?",
+
+    "Hello and welcome! 😊 I'm **TalentBot** from TalentScout. I'll guide you through a quick screening "
+    "for technology positions, covering your background and a few technical questions. Rest assured, "
+    "your data is handled securely and never shared outside the hiring process. "
+    "May I start with your full name?",
+
+    "Great to have you here! I'm **TalentBot**, TalentScout's hiring assistant. This is an initial "
+    "screening to match you with the right tech opportunities, and it only takes a few minutes. "
+    "Anything you tell me is kept confidential. First things first: what's your full name?",
+
+    "Welcome! I'm **TalentBot**, and I'll be conducting your initial screening with TalentScout today. "
+    "I'll ask for some basic details and then a few questions tailored to your tech stack. "
+    "Your privacy matters to us, so your information is used strictly for recruitment. "
+    "Could you share your full name to kick things off?",
+]
+
 # ──────────────────────────────────────────────
 # Information Gathering — State-Aware Prompt
 # ──────────────────────────────────────────────
 INFO_GATHERING_PROMPT = """Based on the conversation so far, determine what information the candidate has provided and what still needs to be collected.
 
-## Required Fields (check which are already collected):
-- Full Name: {full_name}
-- Email Address: {email}
-- Phone Number: {phone}
-- Years of Experience: {years_of_experience}
-- Desired Position(s): {desired_positions}
-- Current Location: {current_location}
-- Tech Stack: {tech_stack}
+## Required Fields:
+Full Name, Email Address, Phone Number, Years of Experience, Desired Position(s), Current Location, Tech Stack
+
+Which fields are already collected is listed under "Current Conversation State".
 
 ## Instructions:
-1. Analyze the candidate's latest message and extract any information they provided
+1. Analyze the candidate's latest message and note any information they provided
 2. Acknowledge what they shared naturally
 3. Ask for the NEXT missing piece of information
 4. If ALL fields are collected, confirm the information summary and transition to technical questions
 
 ## Response Format:
-Respond conversationally. Do NOT use JSON or structured format in your response to the candidate.
+Respond conversationally. Do NOT use JSON or structured format in your response to the candidate."""
+
+# ──────────────────────────────────────────────
+# Information Extraction (JSON mode, runs alongside the reply)
+# ──────────────────────────────────────────────
+EXTRACTION_PROMPT = """You extract structured candidate information from a recruitment screening conversation.
+
+Read the conversation and identify which of these fields the candidate has provided:
+full_name, email, phone, years_of_experience, desired_positions, current_location, tech_stack
+
+## Rules:
+- Only use information the candidate stated themselves — never guess
+- Use null for any field that has not been provided
+- Set "all_collected" to true only if every field has a value
+- Classify the emotional tone of the candidate's LATEST message as ONE of: positive, neutral, negative, excited, nervous, confident
 
-## Data Extraction (internal):
-After your conversational response, on a new line, output EXACTLY this JSON block for internal processing:
-```json
-{{
-  "extracted": {{
+Respond with ONLY a JSON object in exactly this shape:
+{
+  "extracted": {
     "full_name": "<value or null>",
     "email": "<value or null>",
     "phone": "<value or null>",
@@ -103,10 +165,11 @@ After your conversational response, on a new line, output EXACTLY this JSON bloc
     "desired_positions": "<value or null>",
     "current_location": "<value or null>",
     "tech_stack": "<value or null>"
-  }},
-  "all_collected": <true or false>
-}}
-```"""
+  },
+  "all_collected": <true or false>,
+  "sentiment": "<label>",
+  "confidence": <0.0-1.0>
+}"""
 
 # ──────────────────────────────────────────────
 # Technical Question Generation
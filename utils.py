@@ -7,7 +7,44 @@ import re
 import json
 import hashlib
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, NamedTuple, Optional, Pattern, Tuple
+
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
+# Patterns are compiled once at import rather than looked up in re's cache per call
+# Dots only appear between atoms, so no two quantifiers compete for the same characters
+_EMAIL_RE = re.compile(
+    r'^[A-Za-z0-9_%+-]+(?:\.[A-Za-z0-9_%+-]+)*@(?:[A-Za-z0-9-]+\.)+[A-Za-z]{2,}$'
+)
+_EMAIL_MAX_LENGTH = 254  # RFC 5321 path limit
+_PII_FIELDS = frozenset(('email', 'phone', 'full_name'))
+# Prepared once and copied per value; the personalization domain-separates PII hashes
+_PII_HASHER = hashlib.blake2b(digest_size=6, person=b"talentscout-pii")
+_PRIVACY_NOTICE = "PII fields have been hashed for GDPR compliance"
+_PHONE_STRIP = str.maketrans('', '', ' \t\n\r\f\v\x1c\x1d\x1e\x1f-().')  # ASCII separators removed before validation
+_PHONE_RE = re.compile(r'^\+?\d{7,15}$')
+_WS_RE = re.compile(r'\s+')
+# Either JSON variant the model may append to a reply, removed in one scan
+_JSON_BLOCK_RE = re.compile(
+    r"""
+    (?P<fence> ```json \s* \{.*?\} \s* ``` )               # fenced block
+    | (?P<raw> \{ [^{}]* "extracted" [^{}]* \{.*?\} .*? \} )  # bare extraction object
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+_TECH_DELIMITERS = str.maketrans(';/\n', ',,,')  # Fold every delimiter into ',' for one split
+# One pass per line classifies it as a header or a question via the matched group
+_QUESTION_LINE_RE = re.compile(
+    r'^(?:#{1,4}\s*[🔹\*]*\s*\[?\s*(?P<header_hash>.+?)\s*\]?\s*\**\s*'
+    r'|\*\*(?P<header_bold>.+?)\*\*\s*'
+    r'|\d+[.\)]\s*(?P<q_num>.+)'
+    r'|[-•]\s*(?P<q_bullet>.+)'
+    r')$'
+)
 
 
 def validate_email(email: str) -> bool:
@@ -20,8 +57,10 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid email format, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email.strip()))
+    email = email.strip()
+    if len(email) > _EMAIL_MAX_LENGTH or '@' not in email:
+        return False
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_phone(phone: str) -> bool:
@@ -35,10 +74,12 @@ def validate_phone(phone: str) -> bool:
         True if valid phone format, False otherwise
     """
     # Remove spaces, dashes, parentheses for validation
-    cleaned = re.sub(r'[\s\-\(\)\.]+', '', phone.strip())
+    cleaned = phone.translate(_PHONE_STRIP)
+    if not cleaned.isascii():
+        # Unicode spaces (NBSP, U+2007, U+202F, ...) from pasted or locale-formatted numbers
+        cleaned = _WS_RE.sub('', cleaned)
     # Must be 7-15 digits, optionally starting with +
-    pattern = r'^\+?\d{7,15}$'
-    return bool(re.match(pattern, cleaned))
+    return bool(_PHONE_RE.match(cleaned))
 
 
 def sanitize_input(text: str) -> str:
@@ -53,16 +94,30 @@ def sanitize_input(text: str) -> str:
     """
     # Remove potential injection patterns
     text = text.strip()
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    # Remove excessive whitespace. isprintable() is False for every whitespace
+    # character except ' ', so without a double space there is nothing to collapse
+    if '  ' in text or not text.isprintable():
+        text = _WS_RE.sub(' ', text)
     # Limit length to prevent abuse
     return text[:2000]
 
 
+# Parse JSON text, using orjson when it is installed. Bound once at import so
+# each call goes straight to the C parser with no wrapper frame or branch.
+loads_json = orjson.loads if orjson is not None else json.loads
+
+
+def dumps_canonical(obj) -> bytes:
+    """Serialize to compact JSON with sorted keys, suitable for hashing."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
+
 def extract_json_from_response(response: str) -> Optional[dict]:
     """
-    Extract JSON block from LLM response text.
-    The LLM is instructed to include a JSON block for structured data extraction.
+    Extract JSON from LLM response text.
+    Accepts a bare JSON object (JSON mode) or a JSON block embedded in prose.
     
     Args:
         response: Full LLM response text
@@ -70,25 +125,69 @@ def extract_json_from_response(response: str) -> Optional[dict]:
     Returns:
         Parsed JSON dict if found, None otherwise
     """
-    # Try to find JSON block in code fence
-    json_match = re.search(r'```json\s*(\{.*?\})\s*```', response, re.DOTALL)
-    if json_match:
+    # JSON-mode responses are a bare object
+    stripped = response.strip()
+    if stripped.startswith('{'):
         try:
-            return json.loads(json_match.group(1))
+            return loads_json(stripped)
         except json.JSONDecodeError:
             pass
+
+    # Try to find JSON block in code fence
+    fence = response.find('```json')
+    if fence != -1:
+        start = response.find('{', fence + 7)
+        if start != -1 and not response[fence + 7:start].strip():
+            end = _object_end(response, start)
+            if end != -1:
+                try:
+                    return loads_json(response[start:end + 1])
+                except json.JSONDecodeError:
+                    pass
     
-    # Try to find raw JSON object
-    json_match = re.search(r'\{[^{}]*"extracted"[^{}]*\{.*?\}.*?\}', response, re.DOTALL)
-    if json_match:
-        try:
-            return json.loads(json_match.group(0))
-        except json.JSONDecodeError:
-            pass
+    # Try to find raw JSON object, opening on the nearest brace before "extracted"
+    anchor = response.find('"extracted"')
+    if anchor != -1:
+        start = response.rfind('{', 0, anchor)
+        if start != -1 and response.find('}', start, anchor) == -1:
+            end = _object_end(response, start)
+            if end != -1:
+                try:
+                    return loads_json(response[start:end + 1])
+                except json.JSONDecodeError:
+                    pass
     
     return None
 
 
+def _object_end(text: str, start: int) -> int:
+    """
+    Return the index of the brace closing the JSON object opened at
+    text[start], or -1 if it is unbalanced. Braces inside strings are ignored.
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
 def strip_json_from_response(response: str) -> str:
     """
     Remove the JSON extraction block from the LLM response 
@@ -100,12 +199,12 @@ def strip_json_from_response(response: str) -> str:
     Returns:
         Clean conversational response without JSON
     """
-    # Remove ```json ... ``` blocks
-    cleaned = re.sub(r'```json\s*\{.*?\}\s*```', '', response, flags=re.DOTALL)
-    # Remove any trailing raw JSON objects
-    cleaned = re.sub(r'\{[^{}]*"extracted"[^{}]*\{.*?\}.*?\}', '', cleaned, flags=re.DOTALL)
-    # Clean up extra whitespace
-    cleaned = re.sub(r'\n{3,}', '\n\n', cleaned.strip())
+    # Remove ```json ... ``` blocks and any raw JSON objects in a single pass
+    cleaned = _JSON_BLOCK_RE.sub('', response) if '{' in response else response
+    # Clean up extra whitespace; the common case pays a single substring scan
+    cleaned = cleaned.strip()
+    while '\n\n\n' in cleaned:
+        cleaned = cleaned.replace('\n\n\n', '\n\n')
     return cleaned
 
 
@@ -120,56 +219,126 @@ def anonymize_data(data: dict) -> dict:
     Returns:
         Anonymized dictionary with PII hashed
     """
-    pii_fields = ['email', 'phone', 'full_name']
-    anonymized = data.copy()
-    for field in pii_fields:
-        if field in anonymized and anonymized[field]:
-            # Create a one-way hash of the PII
-            anonymized[field] = hashlib.sha256(
-                anonymized[field].encode()
-            ).hexdigest()[:12] + "..."
-    return anonymized
-
-
-def export_candidate_data(candidate_data: dict, filename: str = None) -> str:
+    return {k: (_hash_pii(v) if v and k in _PII_FIELDS else v) for k, v in data.items()}
+
+
+@lru_cache(maxsize=4096)
+def _hash_pii(value: str) -> str:
+    """
+    One-way hash of a PII value. BLAKE2b emits the 12 hex chars directly,
+    and copying the prepared hasher skips re-initialising its parameters.
+    Memoized, since the same candidate is re-exported after every change.
+    The memo maps raw PII to hashes process-wide; see clear_pii_cache().
+    """
+    hasher = _PII_HASHER.copy()
+    hasher.update(value.encode())
+    return hasher.hexdigest() + "..."
+
+
+def clear_pii_cache() -> None:
+    """Drop the raw PII values memoized by the export hashing."""
+    _hash_pii.cache_clear()
+
+
+def export_candidate_data(
+    candidate_data: dict, filename: str = None, timestamp: Optional[str] = None
+) -> str:
     """
     Export candidate data to a JSON file (anonymized).
     
     Args:
         candidate_data: Dictionary of candidate information
         filename: Optional custom filename
+        timestamp: Optional ISO export date, so a batch can share one timestamp
     
     Returns:
         JSON string of the exported data
     """
     export = {
-        "export_date": datetime.now().isoformat(),
+        "export_date": timestamp or datetime.now().isoformat(),
         "candidate": anonymize_data(candidate_data),
-        "privacy_notice": "PII fields have been hashed for GDPR compliance",
+        "privacy_notice": _PRIVACY_NOTICE,
     }
-    return json.dumps(export, indent=2)
+    if orjson is not None:
+        return orjson.dumps(export, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(export, indent=2, separators=(',', ': '))
+
+
+# Exit keywords, already lowercased by the caller (see config.EXIT_KEYWORDS)
+ExitKeywords = FrozenSet[str]
 
 
-def check_exit_intent(message: str, exit_keywords: set) -> bool:
+class ExitMatcher(NamedTuple):
+    """Exit keywords preprocessed once by build_exit_matcher()."""
+    prefixes: Tuple[str, ...]
+    pattern: Pattern[str]
+
+
+def build_exit_matcher(exit_keywords: ExitKeywords) -> ExitMatcher:
+    """
+    Preprocess exit keywords for check_exit_intent().
+    
+    Longest keywords come first so multi-word phrases win over their
+    prefixes; a keyword must end at a word boundary, so "quite" is not "quit".
+    
+    Args:
+        exit_keywords: Keywords that end the conversation, already lowercased;
+            check_exit_intent() lowercases only the message
+    
+    Returns:
+        ExitMatcher to pass to check_exit_intent()
+    """
+    prefixes = tuple(sorted(exit_keywords, key=len, reverse=True))
+    pattern = re.compile(
+        "^(?:" + "|".join(re.escape(k) for k in prefixes) + r")(?!\w)"
+    )
+    return ExitMatcher(prefixes, pattern)
+
+
+def check_exit_intent(message: str, exit_matcher: ExitMatcher) -> bool:
     """
     Check if the user's message indicates intent to end the conversation.
     
     Args:
         message: User's message text
-        exit_keywords: Set of keywords that signal exit intent
+        exit_matcher: Exit keywords prepared by build_exit_matcher()
     
     Returns:
         True if exit intent detected
     """
     normalized = message.strip().lower()
-    # Check exact match
-    if normalized in exit_keywords:
-        return True
-    # Check if message starts with an exit keyword
-    for keyword in exit_keywords:
-        if normalized.startswith(keyword):
-            return True
-    return False
+    # Most messages start with no keyword at all; reject those in one C-level call
+    if not normalized.startswith(exit_matcher.prefixes):
+        return False
+    return exit_matcher.pattern.match(normalized) is not None
+
+
+def classify_sentiment_fast(
+    message: str,
+    patterns: Dict[str, Pattern[str]],
+    negation_pattern: Pattern[str],
+    max_words: int,
+) -> Optional[str]:
+    """
+    Classify sentiment locally for short or obvious messages.
+    
+    Args:
+        message: User's message text
+        patterns: Compiled keyword pattern per sentiment label
+        negation_pattern: Pattern for negations, outside the matched keywords, that make a hit unreliable
+        max_words: Messages up to this length with no keyword hits count as neutral
+    
+    Returns:
+        The sentiment label, or None if the message needs the LLM
+    """
+    hits = [label for label, pattern in patterns.items() if pattern.search(message)]
+    if not hits:
+        return "neutral" if len(message.split()) <= max_words else None
+    if len(hits) != 1:
+        return None
+    # Negations inside a lexicon phrase ("not sure", "can't wait") are part of it
+    rest = patterns[hits[0]].sub(" ", message)
+    return None if negation_pattern.search(rest) else hits[0]
 
 
 def format_tech_stack(tech_stack: str) -> list:
@@ -183,17 +352,15 @@ def format_tech_stack(tech_stack: str) -> list:
         List of individual technology names
     """
     # Split by common delimiters
-    techs = re.split(r'[,;/\n]+', tech_stack)
-    # Clean each entry
-    cleaned = [t.strip().strip('-').strip('•').strip() for t in techs]
-    # Remove empty strings and duplicates while preserving order
-    seen = set()
-    result = []
-    for tech in cleaned:
-        if tech and tech.lower() not in seen:
-            seen.add(tech.lower())
-            result.append(tech)
-    return result
+    techs = tech_stack.translate(_TECH_DELIMITERS).split(',')
+    # Remove empty strings and case-insensitive duplicates, keeping the first spelling
+    unique = {}
+    for tech in techs:
+        # Plain strip() also removes Unicode whitespace such as NBSP or U+3000
+        tech = tech.strip().strip('-').strip('•').strip()
+        if tech:
+            unique.setdefault(tech.lower(), tech)
+    return list(unique.values())
 
 
 def parse_technical_questions(response: str) -> list:
@@ -222,31 +389,26 @@ def parse_technical_questions(response: str) -> list:
         if not line:
             continue
 
-        # Detect technology headers (### 🔹 Python, ### Python, **Python**, etc.)
-        tech_match = re.match(
-            r'^#{1,4}\s*[🔹\*]*\s*\[?\s*(.+?)\s*\]?\s*\**\s*$', line
-        )
-        if not tech_match:
-            tech_match = re.match(r'^\*\*(.+?)\*\*\s*$', line)
+        match = _QUESTION_LINE_RE.match(line)
+        if not match:
+            continue
+        kind = match.lastgroup
 
-        if tech_match:
+        # Detect technology headers (### 🔹 Python, ### Python, **Python**, etc.)
+        if kind in ('header_hash', 'header_bold'):
             # Save previous technology's questions
             if current_tech and current_questions:
                 result.append({
                     "technology": current_tech,
                     "questions": current_questions,
                 })
-            current_tech = tech_match.group(1).strip().strip('🔹').strip()
+            current_tech = match.group(kind).strip().strip('🔹').strip()
             current_questions = []
             continue
 
-        # Detect numbered questions (1. Question, 2) Question, - Question)
-        q_match = re.match(r'^[\d]+[.\)]\s*(.+)$', line)
-        if not q_match:
-            q_match = re.match(r'^[-•]\s*(.+)$', line)
-
-        if q_match and current_tech:
-            question = q_match.group(1).strip()
+        # Numbered questions (1. Question, 2) Question, - Question)
+        if current_tech:
+            question = match.group(kind).strip()
             if question and len(question) > 10:  # Filter out very short non-questions
                 current_questions.append(question)
 